@@ -2,9 +2,14 @@ import os
 os.environ["PYTORCH_ENABLE_MPS_FALLBACK"] = "1"
 
 import argparse
+from pathlib import Path
 import pandas as pd
+import torch
 
 from ray import tune
+from ray.tune.schedulers import AsyncHyperBandScheduler
+from ray.tune.search import ConcurrencyLimiter
+from ray.tune.search.optuna import OptunaSearch
 
 from neuralforecast.auto import AutoNHITS
 from neuralforecast.core import NeuralForecast
@@ -25,12 +30,14 @@ if __name__ == '__main__':
     parser = argparse.ArgumentParser()
     parser.add_argument("-horizon", "--horizon", type=int)
     parser.add_argument("-dataset", "--dataset", type=str)
-    parser.add_argument("-num_samples", "--num_samples", default=5, type=int)
+    parser.add_argument("-num_samples", "--num_samples", default=30, type=int)
+    parser.add_argument("-time_budget_s", "--time_budget_s", default=None, type=float)
 
     args = parser.parse_args()
     horizon = args.horizon
     dataset = args.dataset
     num_samples = args.num_samples
+    time_budget_s = args.time_budget_s
 
     assert horizon in [96, 192, 336, 720]
 
@@ -38,7 +45,15 @@ if __name__ == '__main__':
     #Y_df, _, _ = LongHorizon.load(directory='./data/', group=dataset)
     #Y_df['ds'] = pd.to_datetime(Y_df['ds'])
 
-    Y_df = LongHorizon2.load(directory='./data/', group=dataset)
+    # Load the raw csv once (LongHorizon2.load already parses ds), the parquet copy keeps the datetime dtype
+    data_dir = Path(f'./data/{dataset}')
+    data_dir.mkdir(parents=True, exist_ok=True)
+    cache_file = data_dir / 'Y_df.parquet'
+    if cache_file.is_file():
+        Y_df = pd.read_parquet(cache_file)
+    else:
+        Y_df = LongHorizon2.load(directory='./data/', group=dataset)
+        Y_df.to_parquet(cache_file, index=False)
     freq = LongHorizon2Info[dataset].freq
     n_time = len(Y_df.ds.unique())
     #val_size = int(.2 * n_time)
@@ -51,6 +66,10 @@ if __name__ == '__main__':
     if dataset=='ETTm1' and horizon==720:
         input_size = tune.choice([2 * horizon])
 
+    # Split the host cpus between the trials that run concurrently
+    n_devices = max(torch.cuda.device_count(), 1)
+    num_workers = min(4, (os.cpu_count() or 1) // n_devices)
+
     nhits_config = {
         #"learning_rate": tune.choice([1e-3]),                                     # Initial Learning rate
         "learning_rate": tune.loguniform(1e-5, 5e-3),
@@ -68,14 +87,42 @@ if __name__ == '__main__':
         "mlp_units":  tune.choice([[[512, 512], [512, 512], [512, 512]]]),        # 2 512-Layers per block for each stack
         "interpolation_mode": tune.choice(['linear']),                            # Type of multi-step interpolation
         "val_check_steps": tune.choice([100]),                                    # Compute validation every 100 epochs
+        "num_workers_loader": tune.choice([num_workers]),                         # Persistent, pinned loader workers
         "random_seed": tune.randint(1, 10),
+        "enable_progress_bar": tune.choice([False]),                              # Trials report through Tune, no tqdm output
+        "logger": tune.choice([False]),                                           # Validation loss reaches Tune via callback metrics
         }
 
+    # Mixed precision training on gpus with native bf16 support
+    if torch.cuda.is_available() and torch.cuda.is_bf16_supported():
+        nhits_config["precision"] = tune.choice(['bf16-mixed'])
+
+    # Each trial sees the single gpu Ray assigned to it
+    if torch.cuda.is_available():
+        nhits_config["accelerator"] = tune.choice(['gpu'])
+        nhits_config["devices"] = tune.choice([1])
+
+    # Early stop unpromising trials, the rungs are counted in validation
+    # reports (one every val_check_steps), so max_t=10 covers max_steps=1000
+    scheduler = AsyncHyperBandScheduler(time_attr="training_iteration",
+                                        max_t=10,
+                                        grace_period=2,
+                                        reduction_factor=3)
+
+    # TPE proposals only improve once earlier trials have reported, so only
+    # sample as many trials ahead as there are devices to run them on
+    search_alg = ConcurrencyLimiter(OptunaSearch(), max_concurrent=n_devices)
+
+    # Reserve a single gpu per trial so trials run in parallel across devices
     models = [AutoNHITS(h=horizon,
                         loss=HuberLoss(delta=0.5),
                         valid_loss=MAE(),
                         config=nhits_config, 
+                        search_alg=search_alg,
                         num_samples=num_samples,
+                        time_budget_s=time_budget_s,
+                        gpus=int(torch.cuda.is_available()),
+                        scheduler=scheduler,
                         refit_with_val=True)]
 
     nf = NeuralForecast(models=models, freq=freq)
@@ -103,7 +150,5 @@ if __name__ == '__main__':
     print('MAE: ', mae(y_hat, y_true))
 
     # Save Outputs
-    if not os.path.exists(f'./data/{dataset}'):
-        os.makedirs(f'./data/{dataset}')
-    yhat_file = f'./data/{dataset}/{horizon}_forecasts.csv'
-    Y_hat_df.to_csv(yhat_file, index=False)
+    yhat_file = data_dir / f'{horizon}_forecasts.parquet'
+    Y_hat_df.reset_index().to_parquet(yhat_file, index=False, compression='zstd')
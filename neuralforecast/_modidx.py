@@ -1055,18 +1055,32 @@ d = { 'settings': { 'branch': 'main',
                                                                                                              'neuralforecast/models/softs.py'),
                                              'neuralforecast.models.softs.SOFTS': ( 'models.softs.html#softs',
                                                                                     'neuralforecast/models/softs.py'),
+                                             'neuralforecast.models.softs.SOFTS.__getstate__': ( 'models.softs.html#softs.__getstate__',
+                                                                                                 'neuralforecast/models/softs.py'),
                                              'neuralforecast.models.softs.SOFTS.__init__': ( 'models.softs.html#softs.__init__',
                                                                                              'neuralforecast/models/softs.py'),
+                                             'neuralforecast.models.softs.SOFTS.capture_graph': ( 'models.softs.html#softs.capture_graph',
+                                                                                                  'neuralforecast/models/softs.py'),
                                              'neuralforecast.models.softs.SOFTS.forecast': ( 'models.softs.html#softs.forecast',
                                                                                              'neuralforecast/models/softs.py'),
                                              'neuralforecast.models.softs.SOFTS.forward': ( 'models.softs.html#softs.forward',
                                                                                             'neuralforecast/models/softs.py'),
+                                             'neuralforecast.models.softs.SOFTS.setup': ( 'models.softs.html#softs.setup',
+                                                                                          'neuralforecast/models/softs.py'),
+                                             'neuralforecast.models.softs.SOFTS.train': ( 'models.softs.html#softs.train',
+                                                                                          'neuralforecast/models/softs.py'),
                                              'neuralforecast.models.softs.STAD': ( 'models.softs.html#stad',
                                                                                    'neuralforecast/models/softs.py'),
                                              'neuralforecast.models.softs.STAD.__init__': ( 'models.softs.html#stad.__init__',
                                                                                             'neuralforecast/models/softs.py'),
                                              'neuralforecast.models.softs.STAD.forward': ( 'models.softs.html#stad.forward',
-                                                                                           'neuralforecast/models/softs.py')},
+                                                                                           'neuralforecast/models/softs.py'),
+                                             'neuralforecast.models.softs._rev_in_denorm': ( 'models.softs.html#_rev_in_denorm',
+                                                                                             'neuralforecast/models/softs.py'),
+                                             'neuralforecast.models.softs._rev_in_norm': ( 'models.softs.html#_rev_in_norm',
+                                                                                           'neuralforecast/models/softs.py'),
+                                             'neuralforecast.models.softs._scripted_rev_in': ( 'models.softs.html#_scripted_rev_in',
+                                                                                               'neuralforecast/models/softs.py')},
             'neuralforecast.models.stemgnn': { 'neuralforecast.models.stemgnn.GLU': ( 'models.stemgnn.html#glu',
                                                                                       'neuralforecast/models/stemgnn.py'),
                                                'neuralforecast.models.stemgnn.GLU.__init__': ( 'models.stemgnn.html#glu.__init__',
@@ -1102,7 +1116,19 @@ d = { 'settings': { 'branch': 'main',
                                                                                        'neuralforecast/models/tcn.py'),
                                            'neuralforecast.models.tcn.TCN.forward': ( 'models.tcn.html#tcn.forward',
                                                                                       'neuralforecast/models/tcn.py')},
-            'neuralforecast.models.tft': { 'neuralforecast.models.tft.GLU': ('models.tft.html#glu', 'neuralforecast/models/tft.py'),
+            'neuralforecast.models.tft': { 'neuralforecast.models.tft.BatchedGRN': ( 'models.tft.html#batchedgrn',
+                                                                                     'neuralforecast/models/tft.py'),
+                                           'neuralforecast.models.tft.BatchedGRN.__init__': ( 'models.tft.html#batchedgrn.__init__',
+                                                                                              'neuralforecast/models/tft.py'),
+                                           'neuralforecast.models.tft.BatchedGRN._linear': ( 'models.tft.html#batchedgrn._linear',
+                                                                                             'neuralforecast/models/tft.py'),
+                                           'neuralforecast.models.tft.BatchedGRN._load_from_state_dict': ( 'models.tft.html#batchedgrn._load_from_state_dict',
+                                                                                                           'neuralforecast/models/tft.py'),
+                                           'neuralforecast.models.tft.BatchedGRN.forward': ( 'models.tft.html#batchedgrn.forward',
+                                                                                             'neuralforecast/models/tft.py'),
+                                           'neuralforecast.models.tft.BatchedGRN.reset_parameters': ( 'models.tft.html#batchedgrn.reset_parameters',
+                                                                                                      'neuralforecast/models/tft.py'),
+                                           'neuralforecast.models.tft.GLU': ('models.tft.html#glu', 'neuralforecast/models/tft.py'),
                                            'neuralforecast.models.tft.GLU.__init__': ( 'models.tft.html#glu.__init__',
                                                                                        'neuralforecast/models/tft.py'),
                                            'neuralforecast.models.tft.GLU.forward': ( 'models.tft.html#glu.forward',
@@ -1110,6 +1136,8 @@ d = { 'settings': { 'branch': 'main',
                                            'neuralforecast.models.tft.GRN': ('models.tft.html#grn', 'neuralforecast/models/tft.py'),
                                            'neuralforecast.models.tft.GRN.__init__': ( 'models.tft.html#grn.__init__',
                                                                                        'neuralforecast/models/tft.py'),
+                                           'neuralforecast.models.tft.GRN._load_from_state_dict': ( 'models.tft.html#grn._load_from_state_dict',
+                                                                                                    'neuralforecast/models/tft.py'),
                                            'neuralforecast.models.tft.GRN.forward': ( 'models.tft.html#grn.forward',
                                                                                       'neuralforecast/models/tft.py'),
                                            'neuralforecast.models.tft.InterpretableMultiHeadAttention': ( 'models.tft.html#interpretablemultiheadattention',
@@ -1118,12 +1146,6 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                    'neuralforecast/models/tft.py'),
                                            'neuralforecast.models.tft.InterpretableMultiHeadAttention.forward': ( 'models.tft.html#interpretablemultiheadattention.forward',
                                                                                                                   'neuralforecast/models/tft.py'),
-                                           'neuralforecast.models.tft.MaybeLayerNorm': ( 'models.tft.html#maybelayernorm',
-                                                                                         'neuralforecast/models/tft.py'),
-                                           'neuralforecast.models.tft.MaybeLayerNorm.__init__': ( 'models.tft.html#maybelayernorm.__init__',
-                                                                                                  'neuralforecast/models/tft.py'),
-                                           'neuralforecast.models.tft.MaybeLayerNorm.forward': ( 'models.tft.html#maybelayernorm.forward',
-                                                                                                 'neuralforecast/models/tft.py'),
                                            'neuralforecast.models.tft.StaticCovariateEncoder': ( 'models.tft.html#staticcovariateencoder',
                                                                                                  'neuralforecast/models/tft.py'),
                                            'neuralforecast.models.tft.StaticCovariateEncoder.__init__': ( 'models.tft.html#staticcovariateencoder.__init__',
@@ -1131,8 +1153,14 @@ d = { 'settings': { 'branch': 'main',
                                            'neuralforecast.models.tft.StaticCovariateEncoder.forward': ( 'models.tft.html#staticcovariateencoder.forward',
                                                                                                          'neuralforecast/models/tft.py'),
                                            'neuralforecast.models.tft.TFT': ('models.tft.html#tft', 'neuralforecast/models/tft.py'),
+                                           'neuralforecast.models.tft.TFT.__getstate__': ( 'models.tft.html#tft.__getstate__',
+                                                                                           'neuralforecast/models/tft.py'),
                                            'neuralforecast.models.tft.TFT.__init__': ( 'models.tft.html#tft.__init__',
                                                                                        'neuralforecast/models/tft.py'),
+                                           'neuralforecast.models.tft.TFT._graphed_training_core': ( 'models.tft.html#tft._graphed_training_core',
+                                                                                                     'neuralforecast/models/tft.py'),
+                                           'neuralforecast.models.tft.TFT._submodule': ( 'models.tft.html#tft._submodule',
+                                                                                         'neuralforecast/models/tft.py'),
                                            'neuralforecast.models.tft.TFT.attention_weights': ( 'models.tft.html#tft.attention_weights',
                                                                                                 'neuralforecast/models/tft.py'),
                                            'neuralforecast.models.tft.TFT.feature_importance_correlations': ( 'models.tft.html#tft.feature_importance_correlations',
@@ -1143,6 +1171,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                       'neuralforecast/models/tft.py'),
                                            'neuralforecast.models.tft.TFT.mean_on_batch': ( 'models.tft.html#tft.mean_on_batch',
                                                                                             'neuralforecast/models/tft.py'),
+                                           'neuralforecast.models.tft.TFT.setup': ( 'models.tft.html#tft.setup',
+                                                                                    'neuralforecast/models/tft.py'),
                                            'neuralforecast.models.tft.TFTEmbedding': ( 'models.tft.html#tftembedding',
                                                                                        'neuralforecast/models/tft.py'),
                                            'neuralforecast.models.tft.TFTEmbedding.__init__': ( 'models.tft.html#tftembedding.__init__',
@@ -1169,6 +1199,14 @@ d = { 'settings': { 'branch': 'main',
                                                                                                             'neuralforecast/models/tft.py'),
                                            'neuralforecast.models.tft.VariableSelectionNetwork.forward': ( 'models.tft.html#variableselectionnetwork.forward',
                                                                                                            'neuralforecast/models/tft.py'),
+                                           'neuralforecast.models.tft._TFTTrainingCore': ( 'models.tft.html#_tfttrainingcore',
+                                                                                           'neuralforecast/models/tft.py'),
+                                           'neuralforecast.models.tft._TFTTrainingCore.__init__': ( 'models.tft.html#_tfttrainingcore.__init__',
+                                                                                                    'neuralforecast/models/tft.py'),
+                                           'neuralforecast.models.tft._TFTTrainingCore.forward': ( 'models.tft.html#_tfttrainingcore.forward',
+                                                                                                   'neuralforecast/models/tft.py'),
+                                           'neuralforecast.models.tft._glu_add_layer_norm': ( 'models.tft.html#_glu_add_layer_norm',
+                                                                                              'neuralforecast/models/tft.py'),
                                            'neuralforecast.models.tft.get_activation_fn': ( 'models.tft.html#get_activation_fn',
                                                                                             'neuralforecast/models/tft.py')},
             'neuralforecast.models.tide': { 'neuralforecast.models.tide.MLPResidual': ( 'models.tide.html#mlpresidual',
@@ -1404,6 +1442,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                              'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataModule.__init__': ( 'tsdataset.html#timeseriesdatamodule.__init__',
                                                                                                       'neuralforecast/tsdataset.py'),
+                                          'neuralforecast.tsdataset.TimeSeriesDataModule._worker_kwargs': ( 'tsdataset.html#timeseriesdatamodule._worker_kwargs',
+                                                                                                            'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataModule.predict_dataloader': ( 'tsdataset.html#timeseriesdatamodule.predict_dataloader',
                                                                                                                 'neuralforecast/tsdataset.py'),
                                           'neuralforecast.tsdataset.TimeSeriesDataModule.train_dataloader': ( 'tsdataset.html#timeseriesdatamodule.train_dataloader',
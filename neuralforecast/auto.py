@@ -89,6 +89,8 @@ class AutoRNN(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        time_budget_s=None,
     ):
         """Auto RNN
 
@@ -114,6 +116,8 @@ class AutoRNN(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
         )
 
     @classmethod
@@ -164,6 +168,8 @@ class AutoLSTM(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        time_budget_s=None,
     ):
 
         # Define search space, input/output sizes
@@ -185,6 +191,8 @@ class AutoLSTM(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
         )
 
     @classmethod
@@ -235,6 +243,8 @@ class AutoGRU(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        time_budget_s=None,
     ):
 
         # Define search space, input/output sizes
@@ -256,6 +266,8 @@ class AutoGRU(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
         )
 
     @classmethod
@@ -305,6 +317,8 @@ class AutoTCN(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        time_budget_s=None,
     ):
 
         # Define search space, input/output sizes
@@ -326,6 +340,8 @@ class AutoTCN(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
         )
 
     @classmethod
@@ -378,6 +394,8 @@ class AutoDeepAR(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        time_budget_s=None,
     ):
 
         # Define search space, input/output sizes
@@ -399,6 +417,8 @@ class AutoDeepAR(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
         )
 
     @classmethod
@@ -448,6 +468,8 @@ class AutoDilatedRNN(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        time_budget_s=None,
     ):
 
         # Define search space, input/output sizes
@@ -469,6 +491,8 @@ class AutoDilatedRNN(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
         )
 
     @classmethod
@@ -518,6 +542,8 @@ class AutoBiTCN(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        time_budget_s=None,
     ):
 
         # Define search space, input/output sizes
@@ -539,6 +565,8 @@ class AutoBiTCN(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
         )
 
     @classmethod
@@ -586,6 +614,8 @@ class AutoMLP(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        time_budget_s=None,
     ):
 
         # Define search space, input/output sizes
@@ -607,6 +637,8 @@ class AutoMLP(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
         )
 
     @classmethod
@@ -652,6 +684,8 @@ class AutoNBEATS(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        time_budget_s=None,
     ):
 
         # Define search space, input/output sizes
@@ -673,6 +707,8 @@ class AutoNBEATS(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
         )
 
     @classmethod
@@ -718,6 +754,8 @@ class AutoNBEATSx(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        time_budget_s=None,
     ):
 
         # Define search space, input/output sizes
@@ -739,6 +777,8 @@ class AutoNBEATSx(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
         )
 
     @classmethod
@@ -797,6 +837,8 @@ class AutoNHITS(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        time_budget_s=None,
     ):
 
         # Define search space, input/output sizes
@@ -818,6 +860,8 @@ class AutoNHITS(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
         )
 
     @classmethod
@@ -864,6 +908,8 @@ class AutoDLinear(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        time_budget_s=None,
     ):
 
         # Define search space, input/output sizes
@@ -885,6 +931,8 @@ class AutoDLinear(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
         )
 
     @classmethod
@@ -930,6 +978,8 @@ class AutoNLinear(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        time_budget_s=None,
     ):
 
         # Define search space, input/output sizes
@@ -951,6 +1001,8 @@ class AutoNLinear(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
         )
 
     @classmethod
@@ -1004,6 +1056,8 @@ class AutoTiDE(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        time_budget_s=None,
     ):
 
         # Define search space, input/output sizes
@@ -1025,6 +1079,8 @@ class AutoTiDE(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
         )
 
     @classmethod
@@ -1073,6 +1129,8 @@ class AutoDeepNPTS(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        time_budget_s=None,
     ):
 
         # Define search space, input/output sizes
@@ -1094,6 +1152,8 @@ class AutoDeepNPTS(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
         )
 
     @classmethod
@@ -1142,6 +1202,8 @@ class AutoKAN(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        time_budget_s=None,
     ):
 
         # Define search space, input/output sizes
@@ -1163,6 +1225,8 @@ class AutoKAN(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
         )
 
     @classmethod
@@ -1210,6 +1274,8 @@ class AutoTFT(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        time_budget_s=None,
     ):
 
         # Define search space, input/output sizes
@@ -1231,6 +1297,8 @@ class AutoTFT(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
         )
 
     @classmethod
@@ -1278,6 +1346,8 @@ class AutoVanillaTransformer(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        time_budget_s=None,
     ):
 
         # Define search space, input/output sizes
@@ -1299,6 +1369,8 @@ class AutoVanillaTransformer(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
         )
 
     @classmethod
@@ -1346,6 +1418,8 @@ class AutoInformer(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        time_budget_s=None,
     ):
 
         # Define search space, input/output sizes
@@ -1367,6 +1441,8 @@ class AutoInformer(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
         )
 
     @classmethod
@@ -1414,6 +1490,8 @@ class AutoAutoformer(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        time_budget_s=None,
     ):
 
         # Define search space, input/output sizes
@@ -1435,6 +1513,8 @@ class AutoAutoformer(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
         )
 
     @classmethod
@@ -1481,6 +1561,8 @@ class AutoFEDformer(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        time_budget_s=None,
     ):
 
         # Define search space, input/output sizes
@@ -1502,6 +1584,8 @@ class AutoFEDformer(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
         )
 
     @classmethod
@@ -1551,6 +1635,8 @@ class AutoPatchTST(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        time_budget_s=None,
     ):
 
         # Define search space, input/output sizes
@@ -1572,6 +1658,8 @@ class AutoPatchTST(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
         )
 
     @classmethod
@@ -1620,6 +1708,8 @@ class AutoiTransformer(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        time_budget_s=None,
     ):
 
         # Define search space, input/output sizes
@@ -1652,6 +1742,8 @@ class AutoiTransformer(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
         )
 
     @classmethod
@@ -1704,6 +1796,8 @@ class AutoTimesNet(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        time_budget_s=None,
     ):
 
         # Define search space, input/output sizes
@@ -1725,6 +1819,8 @@ class AutoTimesNet(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
         )
 
     @classmethod
@@ -1773,6 +1869,8 @@ class AutoStemGNN(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        time_budget_s=None,
     ):
 
         # Define search space, input/output sizes
@@ -1805,6 +1903,8 @@ class AutoStemGNN(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
         )
 
     @classmethod
@@ -1845,6 +1945,8 @@ class AutoHINT(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        time_budget_s=None,
     ):
 
         super(AutoHINT, self).__init__(
@@ -1862,6 +1964,8 @@ class AutoHINT(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
         )
         if backend == "optuna":
             raise Exception("Optuna is not supported for AutoHINT.")
@@ -1931,6 +2035,8 @@ class AutoTSMixer(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        time_budget_s=None,
     ):
 
         # Define search space, input/output sizes
@@ -1963,6 +2069,8 @@ class AutoTSMixer(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
         )
 
     @classmethod
@@ -2017,6 +2125,8 @@ class AutoTSMixerx(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        time_budget_s=None,
     ):
 
         # Define search space, input/output sizes
@@ -2049,6 +2159,8 @@ class AutoTSMixerx(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
         )
 
     @classmethod
@@ -2102,6 +2214,8 @@ class AutoMLPMultivariate(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        time_budget_s=None,
     ):
 
         # Define search space, input/output sizes
@@ -2134,6 +2248,8 @@ class AutoMLPMultivariate(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
         )
 
     @classmethod
@@ -2187,6 +2303,8 @@ class AutoSOFTS(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        time_budget_s=None,
     ):
 
         # Define search space, input/output sizes
@@ -2219,6 +2337,8 @@ class AutoSOFTS(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
         )
 
     @classmethod
@@ -2273,6 +2393,8 @@ class AutoTimeMixer(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        time_budget_s=None,
     ):
 
         # Define search space, input/output sizes
@@ -2305,6 +2427,8 @@ class AutoTimeMixer(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
         )
 
     @classmethod
@@ -2361,6 +2485,8 @@ class AutoRMoK(BaseAuto):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        time_budget_s=None,
     ):
 
         # Define search space, input/output sizes
@@ -2393,6 +2519,8 @@ class AutoRMoK(BaseAuto):
             alias=alias,
             backend=backend,
             callbacks=callbacks,
+            scheduler=scheduler,
+            time_budget_s=time_budget_s,
         )
 
     @classmethod
@@ -65,11 +65,12 @@ class BaseAuto(pl.LightningModule):
         For ray see https://docs.ray.io/en/latest/tune/api_docs/suggestion.html
         For optuna see https://optuna.readthedocs.io/en/stable/reference/samplers/index.html.
     num_samples : int
-        Number of hyperparameter optimization steps/samples.
+        Number of hyperparameter optimization steps/samples. -1 keeps sampling until `time_budget_s` runs out, and requires it to be set.
     cpus : int (default=os.cpu_count())
-        Number of cpus to use during optimization. Only used with ray tune.
+        Number of cpus reserved by each trial when no gpus are requested. Only used with ray tune.
     gpus : int (default=torch.cuda.device_count())
-        Number of gpus to use during optimization, default all available. Only used with ray tune.
+        Number of gpus reserved by each trial, default all available. Trials run concurrently
+        when `gpus` is below the available count, e.g. `gpus=1` runs one trial per device. Only used with ray tune.
     refit_with_val : bool
         Refit of best model should preserve val_size.
     verbose : bool
@@ -82,6 +83,11 @@ class BaseAuto(pl.LightningModule):
         List of functions to call during the optimization process.
         ray reference: https://docs.ray.io/en/latest/tune/tutorials/tune-metrics.html
         optuna reference: https://optuna.readthedocs.io/en/stable/tutorial/20_recipes/007_optuna_callback.html
+    scheduler : ray.tune.schedulers variant, optional (default=None)
+        Trial scheduler to stop or pause unpromising trials early, FIFO by default. Only used with ray tune.
+        For ray see https://docs.ray.io/en/latest/tune/api/schedulers.html
+    time_budget_s : float, optional (default=None)
+        Wall clock budget in seconds for the whole optimization, no new trials are started once it is spent.
     """
 
     def __init__(
@@ -100,6 +106,8 @@ class BaseAuto(pl.LightningModule):
         alias=None,
         backend="ray",
         callbacks=None,
+        scheduler=None,
+        time_budget_s=None,
     ):
         super(BaseAuto, self).__init__()
         with warnings.catch_warnings(record=False):
@@ -125,6 +133,10 @@ class BaseAuto(pl.LightningModule):
             raise ValueError(
                 f"Unknown backend {backend}. The supported backends are 'ray' and 'optuna'."
             )
+        if num_samples <= 0 and time_budget_s is None:
+            raise ValueError(
+                "`num_samples=-1` samples until the time budget runs out, please also set `time_budget_s`."
+            )
         if config_base.get("h", None) is not None:
             raise Exception("Please use `h` init argument instead of `config['h']`.")
         if config_base.get("loss", None) is not None:
@@ -176,6 +188,8 @@ class BaseAuto(pl.LightningModule):
         self.alias = alias
         self.backend = backend
         self.callbacks = callbacks
+        self.scheduler = scheduler
+        self.time_budget_s = time_budget_s
 
         # Base Class attributes
         self.SAMPLING_TYPE = cls_model.SAMPLING_TYPE
@@ -231,6 +245,8 @@ class BaseAuto(pl.LightningModule):
         num_samples,
         search_alg,
         config,
+        scheduler=None,
+        time_budget_s=None,
     ):
         train_fn_with_parameters = tune.with_parameters(
             self._train_tune,
@@ -263,6 +279,8 @@ class BaseAuto(pl.LightningModule):
                 mode="min",
                 num_samples=num_samples,
                 search_alg=search_alg,
+                scheduler=scheduler,
+                time_budget_s=time_budget_s,
                 trial_dirname_creator=trial_dirname_creator,
             ),
             param_space=config,
@@ -316,6 +334,7 @@ class BaseAuto(pl.LightningModule):
         search_alg,
         config,
         distributed_config,
+        time_budget_s=None,
     ):
         import optuna
 
@@ -349,7 +368,8 @@ class BaseAuto(pl.LightningModule):
         study = optuna.create_study(sampler=sampler, direction="minimize")
         study.optimize(
             objective,
-            n_trials=num_samples,
+            n_trials=num_samples if num_samples > 0 else None,
+            timeout=time_budget_s,
             show_progress_bar=verbose,
             callbacks=self.callbacks,
         )
@@ -411,6 +431,8 @@ class BaseAuto(pl.LightningModule):
                 num_samples=self.num_samples,
                 search_alg=search_alg,
                 config=self.config,
+                scheduler=deepcopy(self.scheduler),
+                time_budget_s=self.time_budget_s,
             )
             best_config = results.get_best_result().config
         else:
@@ -424,6 +446,7 @@ class BaseAuto(pl.LightningModule):
                 search_alg=search_alg,
                 config=self.config,
                 distributed_config=distributed_config,
+                time_budget_s=self.time_budget_s,
             )
             best_config = results.best_trial.user_attrs["ALL_PARAMS"]
         self.model = self._fit_model(
@@ -8,6 +8,7 @@ __all__ = ['ACTIVATIONS', 'MLP', 'Chomp1d', 'CausalConv1d', 'TemporalConvolution
 
 # %% ../../nbs/common.modules.ipynb 3
 import math
+from typing import List, Optional, Tuple
 
 import torch
 import torch.nn as nn
@@ -212,9 +213,9 @@ class TransEncoderLayer(nn.Module):
         self.norm1 = nn.LayerNorm(hidden_size)
         self.norm2 = nn.LayerNorm(hidden_size)
         self.dropout = nn.Dropout(dropout)
-        self.activation = F.relu if activation == "relu" else F.gelu
+        self.activation = nn.ReLU() if activation == "relu" else nn.GELU()
 
-    def forward(self, x, attn_mask=None):
+    def forward(self, x, attn_mask: Optional[torch.Tensor] = None):
         new_x, attn = self.attention(x, x, x, attn_mask=attn_mask)
 
         x = x + self.dropout(new_x)
@@ -235,24 +236,32 @@ class TransEncoder(nn.Module):
         )
         self.norm = norm_layer
 
-    def forward(self, x, attn_mask=None):
+    def forward(
+        self, x, attn_mask: Optional[torch.Tensor] = None, return_attn: bool = False
+    ) -> Tuple[torch.Tensor, Optional[List[torch.Tensor]]]:
         # x [B, L, D]
-        attns = []
+        # attention maps are only collected on request
+        attns: List[torch.Tensor] = []
         if self.conv_layers is not None:
             for attn_layer, conv_layer in zip(self.attn_layers, self.conv_layers):
                 x, attn = attn_layer(x, attn_mask=attn_mask)
                 x = conv_layer(x)
-                attns.append(attn)
+                if return_attn:
+                    attns.append(attn)
             x, attn = self.attn_layers[-1](x)
-            attns.append(attn)
+            if return_attn:
+                attns.append(attn)
         else:
             for attn_layer in self.attn_layers:
                 x, attn = attn_layer(x, attn_mask=attn_mask)
-                attns.append(attn)
+                if return_attn:
+                    attns.append(attn)
 
         if self.norm is not None:
             x = self.norm(x)
 
+        if not return_attn:
+            return x, None
         return x, attns
 
 # %% ../../nbs/common.modules.ipynb 16
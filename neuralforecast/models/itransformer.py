@@ -63,6 +63,26 @@ class FullAttention(nn.Module):
         _, S, _, D = values.shape
         scale = self.scale or 1.0 / sqrt(E)
 
+        if not self.output_attention:
+            # Fused SDPA kernel (Flash/memory-efficient) never materializes the scores
+            if self.mask_flag and attn_mask is not None:
+                attn_mask = ~attn_mask.mask
+            else:
+                attn_mask = None
+            queries = queries.transpose(1, 2)
+            if self.scale is not None:
+                # SDPA applies 1/sqrt(E) itself
+                queries = queries * (scale * sqrt(E))
+            V = F.scaled_dot_product_attention(
+                queries,
+                keys.transpose(1, 2),
+                values.transpose(1, 2),
+                attn_mask=attn_mask,
+                dropout_p=self.dropout.p if self.training else 0.0,
+                is_causal=self.mask_flag and attn_mask is None,
+            )
+            return (V.transpose(1, 2).contiguous(), None)
+
         scores = torch.einsum("blhe,bshe->bhls", queries, keys)
 
         if self.mask_flag:
@@ -74,10 +94,7 @@ class FullAttention(nn.Module):
         A = self.dropout(torch.softmax(scale * scores, dim=-1))
         V = torch.einsum("bhls,bshd->blhd", A, values)
 
-        if self.output_attention:
-            return (V.contiguous(), A)
-        else:
-            return (V.contiguous(), None)
+        return (V.contiguous(), A)
 
 # %% ../../nbs/models.itransformer.ipynb 11
 class DataEmbedding_inverted(nn.Module):
@@ -4,6 +4,10 @@
 __all__ = ['DataEmbedding_inverted', 'STAD', 'SOFTS']
 
 # %% ../../nbs/models.softs.ipynb 4
+from contextlib import nullcontext
+from functools import lru_cache
+from typing import Optional, Tuple
+
 import torch
 import torch.nn as nn
 import torch.nn.functional as F
@@ -23,14 +27,13 @@ class DataEmbedding_inverted(nn.Module):
         self.value_embedding = nn.Linear(c_in, d_model)
         self.dropout = nn.Dropout(p=dropout)
 
-    def forward(self, x, x_mark):
-        x = x.permute(0, 2, 1)
-        # x: [Batch Variate Time]
-        if x_mark is None:
-            x = self.value_embedding(x)
-        else:
-            # the potential to take covariates (e.g. timestamps) as tokens
-            x = self.value_embedding(torch.cat([x, x_mark.permute(0, 2, 1)], 1))
+    def forward(self, x: torch.Tensor, x_mark: Optional[torch.Tensor]):
+        # x: [Batch Time Variate]
+        if x_mark is not None:
+            # the potential to take covariates (e.g. timestamps) as tokens,
+            # concatenated before the single transpose to [Batch Variate Time]
+            x = torch.cat([x, x_mark], -1)
+        x = self.value_embedding(x.transpose(1, 2))
         # x: [Batch Variate d_model]
         return self.dropout(x)
 
@@ -40,16 +43,23 @@ class STAD(nn.Module):
     STar Aggregate Dispatch Module
     """
 
-    def __init__(self, d_series, d_core):
+    def __init__(self, d_series, d_core, simplified=False):
         super(STAD, self).__init__()
 
-        self.gen1 = nn.Linear(d_series, d_series)
+        # simplified drops the square d_series projection ahead of the core MLP
+        self.gen1 = nn.Identity() if simplified else nn.Linear(d_series, d_series)
         self.gen2 = nn.Linear(d_series, d_core)
         self.gen3 = nn.Linear(d_series + d_core, d_series)
         self.gen4 = nn.Linear(d_series, d_series)
 
-    def forward(self, input, *args, **kwargs):
-        batch_size, channels, d_series = input.shape
+    def forward(
+        self,
+        input: torch.Tensor,
+        keys: torch.Tensor,
+        values: torch.Tensor,
+        attn_mask: Optional[torch.Tensor] = None,
+    ) -> Tuple[torch.Tensor, torch.Tensor]:
+        d_series = input.shape[-1]
 
         # set FFN
         combined_mean = F.gelu(self.gen1(input))
@@ -57,28 +67,56 @@ class STAD(nn.Module):
 
         # stochastic pooling
         if self.training:
-            ratio = F.softmax(combined_mean, dim=1)
-            ratio = ratio.permute(0, 2, 1)
-            ratio = ratio.reshape(-1, channels)
-            indices = torch.multinomial(ratio, 1)
-            indices = indices.view(batch_size, -1, 1).permute(0, 2, 1)
+            # Gumbel-max sampling of one series per core dimension, same
+            # distribution as multinomial(softmax) without the host sync
+            gumbel = -torch.log(
+                -torch.log(torch.rand_like(combined_mean).clamp_min_(1e-20))
+            )
+            indices = (combined_mean + gumbel).argmax(dim=1, keepdim=True)
             combined_mean = torch.gather(combined_mean, 1, indices)
-            combined_mean = combined_mean.repeat(1, channels, 1)
         else:
             weight = F.softmax(combined_mean, dim=1)
-            combined_mean = torch.sum(
-                combined_mean * weight, dim=1, keepdim=True
-            ).repeat(1, channels, 1)
+            combined_mean = torch.sum(combined_mean * weight, dim=1, keepdim=True)
 
-        # mlp fusion
-        combined_mean_cat = torch.cat([input, combined_mean], -1)
-        combined_mean_cat = F.gelu(self.gen3(combined_mean_cat))
+        # mlp fusion, gen3 is applied blockwise instead of on cat([input, core]):
+        # the core is projected once per batch and broadcast over the series
+        combined_mean_cat = F.linear(
+            input, self.gen3.weight[:, :d_series], self.gen3.bias
+        )
+        combined_mean_cat = combined_mean_cat + F.linear(
+            combined_mean, self.gen3.weight[:, d_series:]
+        )
+        combined_mean_cat = F.gelu(combined_mean_cat)
         combined_mean_cat = self.gen4(combined_mean_cat)
         output = combined_mean_cat
 
-        return output, None
+        # STAD has no attention map, an empty tensor keeps the
+        # return type static so the encoder can be scripted
+        return output, torch.empty(0, device=output.device)
 
 # %% ../../nbs/models.softs.ipynb 10
+def _rev_in_norm(x: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+    # Normalization from Non-stationary Transformer, single reduction pass
+    # on detached inputs so autograd does not track either statistic
+    var, means = torch.var_mean(x.detach(), dim=1, keepdim=True, unbiased=False)
+    inv_stdev = torch.rsqrt(var + 1e-5)
+    return (x - means) * inv_stdev, means, 1 / inv_stdev
+
+
+def _rev_in_denorm(
+    y: torch.Tensor, means: torch.Tensor, stdev: torch.Tensor
+) -> torch.Tensor:
+    # De-Normalization from Non-stationary Transformer, stats broadcast over the horizon
+    return torch.addcmul(means, y, stdev)
+
+
+@lru_cache(maxsize=None)
+def _scripted_rev_in():
+    # scripted on the first `jit_mode` forecast instead of at import, so the
+    # fuser can merge the pointwise ops around the statistics on that path
+    return torch.jit.script(_rev_in_norm), torch.jit.script(_rev_in_denorm)
+
+# %% ../../nbs/models.softs.ipynb 12
 class SOFTS(BaseMultivariate):
     """SOFTS
 
@@ -91,10 +129,15 @@ class SOFTS(BaseMultivariate):
     `stat_exog_list`: str list, static exogenous columns.<br>
     `hidden_size`: int, dimension of the model.<br>
     `d_core`: int, dimension of core in STAD.<br>
+    `simplified`: bool=False, whether to remove the first `d_series x d_series` projection in STAD.<br>
     `e_layers`: int, number of encoder layers.<br>
     `d_ff`: int, dimension of fully-connected layer.<br>
     `dropout`: float, dropout rate.<br>
     `use_norm`: bool, whether to normalize or not.<br>
+    `jit_mode`: bool=False, whether to compile the embedding and encoder with `torch.jit.script`.<br>
+    `compile_model`: bool=False, whether to compile `forecast` with `torch.compile`, the first call of each input shape triggers the compilation.<br>
+    `use_cuda_graph`: bool=False, whether to replay inference forecasts on CUDA from graphs captured once per input shape.<br>
+    `autocast_dtype`: torch.dtype, optional, if set (e.g. `torch.bfloat16`) the embedding, encoder and projection run under `torch.autocast`, normalization statistics stay in full precision.<br>
     `loss`: PyTorch module, instantiated train loss class from [losses collection](https://nixtla.github.io/neuralforecast/losses.pytorch.html).<br>
     `valid_loss`: PyTorch module=`loss`, instantiated valid loss class from [losses collection](https://nixtla.github.io/neuralforecast/losses.pytorch.html).<br>
     `max_steps`: int=1000, maximum number of training steps.<br>
@@ -106,7 +149,7 @@ class SOFTS(BaseMultivariate):
     `step_size`: int=1, step size between each window of temporal data.<br>
     `scaler_type`: str='identity', type of scaler for temporal inputs normalization see [temporal scalers](https://nixtla.github.io/neuralforecast/common.scalers.html).<br>
     `random_seed`: int=1, random_seed for pytorch initializer and numpy generators.<br>
-    `num_workers_loader`: int=os.cpu_count(), workers to be used by `TimeSeriesDataLoader`.<br>
+    `num_workers_loader`: int=0, workers to be used by `TimeSeriesDataLoader`.<br>
     `drop_last_loader`: bool=False, if True `TimeSeriesDataLoader` drops last non-full batch.<br>
     `alias`: str, optional,  Custom name of the model.<br>
     `optimizer`: Subclass of 'torch.optim.Optimizer', optional, user specified optimizer instead of the default choice (Adam).<br>
@@ -135,10 +178,15 @@ class SOFTS(BaseMultivariate):
         stat_exog_list=None,
         hidden_size: int = 512,
         d_core: int = 512,
+        simplified: bool = False,
         e_layers: int = 2,
         d_ff: int = 2048,
         dropout: float = 0.1,
         use_norm: bool = True,
+        jit_mode: bool = False,
+        compile_model: bool = False,
+        use_cuda_graph: bool = False,
+        autocast_dtype: Optional[torch.dtype] = None,
         loss=MAE(),
         valid_loss=None,
         max_steps: int = 1000,
@@ -186,11 +234,21 @@ class SOFTS(BaseMultivariate):
             **trainer_kwargs
         )
 
+        if jit_mode and compile_model:
+            raise Exception("jit_mode and compile_model are mutually exclusive.")
+
         self.h = h
         self.enc_in = n_series
         self.dec_in = n_series
         self.c_out = n_series
         self.use_norm = use_norm
+        self.jit_mode = jit_mode
+        self._scripted_modules = {}
+        self.compile_model = compile_model
+        self._compiled_forecast = None
+        self.use_cuda_graph = use_cuda_graph
+        self.autocast_dtype = autocast_dtype
+        self._cuda_graphs = {}
 
         # Architecture
         self.enc_embedding = DataEmbedding_inverted(input_size, hidden_size, dropout)
@@ -198,11 +256,11 @@ class SOFTS(BaseMultivariate):
         self.encoder = TransEncoder(
             [
                 TransEncoderLayer(
-                    STAD(hidden_size, d_core),
+                    STAD(hidden_size, d_core, simplified),
                     hidden_size,
                     d_ff,
                     dropout=dropout,
-                    activation=F.gelu,
+                    activation="gelu",
                 )
                 for l in range(e_layers)
             ]
@@ -210,31 +268,121 @@ class SOFTS(BaseMultivariate):
 
         self.projection = nn.Linear(hidden_size, self.h, bias=True)
 
+    def __getstate__(self):
+        # scripted modules, the compiled forecast and CUDA graphs are bound to this instance,
+        # copies (e.g. the one fitted by NeuralForecast) build their own on `setup`
+        state = super().__getstate__()
+        state["_scripted_modules"] = {}
+        state["_compiled_forecast"] = None
+        state["_cuda_graphs"] = {}
+        return state
+
+    def setup(self, stage):
+        # Scripting is deferred to the trainer. Scripted modules share their
+        # parameters with the eager ones, which stay registered so optimizers,
+        # checkpoints and copies only ever see the eager modules
+        if self.jit_mode and not self._scripted_modules:
+            self._scripted_modules = {
+                "enc_embedding": torch.jit.script(self.enc_embedding),
+                "encoder": torch.jit.script(self.encoder),
+            }
+        if self.compile_model and self._compiled_forecast is None:
+            # CUDA graphs are left to `use_cuda_graph`
+            self._compiled_forecast = torch.compile(self.forecast, dynamic=False)
+
+    def train(self, mode=True):
+        # scripted modules are not registered, they follow the eager mode here
+        super().train(mode)
+        for module in self._scripted_modules.values():
+            module.train(mode)
+        return self
+
     def forecast(self, x_enc):
-        # Normalization from Non-stationary Transformer
+        # jit_mode also runs the RevIN helpers scripted
+        if self._scripted_modules:
+            rev_in_norm, rev_in_denorm = _scripted_rev_in()
+        else:
+            rev_in_norm, rev_in_denorm = _rev_in_norm, _rev_in_denorm
+
         if self.use_norm:
-            means = x_enc.mean(1, keepdim=True).detach()
-            x_enc = x_enc - means
-            stdev = torch.sqrt(
-                torch.var(x_enc, dim=1, keepdim=True, unbiased=False) + 1e-5
-            )
-            x_enc /= stdev
+            x_enc, means, stdev = rev_in_norm(x_enc)
 
         _, _, N = x_enc.shape
-        enc_out = self.enc_embedding(x_enc, None)
-        enc_out, attns = self.encoder(enc_out, attn_mask=None)
-        dec_out = self.projection(enc_out).permute(0, 2, 1)[:, :, :N]
+        # autocast is only entered on request, not every device type supports it
+        if self.autocast_dtype is None:
+            autocast = nullcontext()
+        else:
+            autocast = torch.autocast(
+                device_type=x_enc.device.type, dtype=self.autocast_dtype
+            )
+        with autocast:
+            enc_embedding = self._scripted_modules.get(
+                "enc_embedding", self.enc_embedding
+            )
+            encoder = self._scripted_modules.get("encoder", self.encoder)
+            enc_out = enc_embedding(x_enc, None)
+            enc_out, _ = encoder(enc_out, attn_mask=None, return_attn=False)
+            # project as W @ enc_out^T so the output is produced directly in
+            # a contiguous [B, h, N] layout instead of a permuted view
+            dec_out = torch.matmul(self.projection.weight, enc_out.transpose(1, 2))
+            dec_out = dec_out + self.projection.bias.unsqueeze(-1)
+            dec_out = dec_out[:, :, :N]
+        dec_out = dec_out.to(x_enc.dtype)
 
-        # De-Normalization from Non-stationary Transformer
         if self.use_norm:
-            dec_out = dec_out * (stdev[:, 0, :].unsqueeze(1).repeat(1, self.h, 1))
-            dec_out = dec_out + (means[:, 0, :].unsqueeze(1).repeat(1, self.h, 1))
+            dec_out = rev_in_denorm(dec_out, means, stdev)
         return dec_out
 
+    def capture_graph(self, insample_y):
+        """SOFTS.capture_graph
+
+        Capture `forecast` for inputs shaped like `insample_y` in a CUDA graph,
+        later inference calls with the same shape only copy the input and replay it.
+
+        **Parameters:**<br>
+        `insample_y`: torch.Tensor, sample CUDA input of shape [batch, input_size, n_series].<br>
+        """
+        # captures can be triggered under inference mode (e.g. Lightning validation),
+        # the static tensors are built outside it so later replays can write into them
+        with torch.inference_mode(False), torch.no_grad():
+            static_in = insample_y.detach().clone()
+            # warmup on a side stream, as required before capture
+            stream = torch.cuda.Stream()
+            stream.wait_stream(torch.cuda.current_stream())
+            with torch.cuda.stream(stream):
+                for _ in range(3):
+                    self.forecast(static_in)
+            torch.cuda.current_stream().wait_stream(stream)
+
+            graph = torch.cuda.CUDAGraph()
+            with torch.cuda.graph(graph):
+                static_out = self.forecast(static_in)
+        self._cuda_graphs[tuple(static_in.shape)] = (graph, static_in, static_out)
+
     def forward(self, windows_batch):
         insample_y = windows_batch["insample_y"]
 
-        y_pred = self.forecast(insample_y)
+        if (
+            self.use_cuda_graph
+            and insample_y.is_cuda
+            and not self.training
+            and not torch.is_grad_enabled()
+        ):
+            if tuple(insample_y.shape) not in self._cuda_graphs:
+                self.capture_graph(insample_y)
+            graph, static_in, static_out = self._cuda_graphs[tuple(insample_y.shape)]
+            static_in.copy_(insample_y)
+            graph.replay()
+            y_pred = static_out.clone()
+        elif self._scripted_modules and torch.is_inference_mode_enabled():
+            # the TorchScript interpreter fails under inference mode (e.g. Lightning
+            # validation and predict), no_grad skips autograd all the same
+            with torch.inference_mode(False), torch.no_grad():
+                y_pred = self.forecast(insample_y)
+        elif self._compiled_forecast is not None:
+            y_pred = self._compiled_forecast(insample_y)
+        else:
+            y_pred = self.forecast(insample_y)
         y_pred = y_pred[:, -self.h :, :]
         y_pred = self.loss.domain_map(y_pred)
 
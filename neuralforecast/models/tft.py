@@ -4,6 +4,8 @@
 __all__ = ['TFT']
 
 # %% ../../nbs/models.tft.ipynb 5
+import math
+from contextlib import nullcontext
 from typing import Tuple, Optional, Callable
 
 import torch
@@ -30,18 +32,6 @@ def get_activation_fn(activation_str: str) -> Callable:
     return activation_map.get(activation_str, F.elu)
 
 
-class MaybeLayerNorm(nn.Module):
-    def __init__(self, output_size, hidden_size, eps):
-        super().__init__()
-        if output_size and output_size == 1:
-            self.ln = nn.Identity()
-        else:
-            self.ln = LayerNorm(output_size if output_size else hidden_size, eps=eps)
-
-    def forward(self, x):
-        return self.ln(x)
-
-
 class GLU(nn.Module):
     def __init__(self, hidden_size, output_size):
         super().__init__()
@@ -53,6 +43,16 @@ class GLU(nn.Module):
         return x
 
 
+def _glu_add_layer_norm(
+    x: Tensor, residual: Tensor, weight: Tensor, bias: Tensor, eps: float
+) -> Tensor:
+    # gated skip connection tail: GLU over the [..., 2H] projection,
+    # residual add and LayerNorm. These run as separate kernels in eager mode,
+    # with `compile_model=True` the compiled submodules fuse them
+    x = F.glu(x) + residual
+    return F.layer_norm(x, [x.shape[-1]], weight, bias, eps)
+
+
 class GRN(nn.Module):
     def __init__(
         self,
@@ -64,7 +64,12 @@ class GRN(nn.Module):
         activation="ELU",
     ):
         super().__init__()
-        self.layer_norm = MaybeLayerNorm(output_size, hidden_size, eps=1e-3)
+        if output_size and output_size == 1:
+            self.layer_norm = nn.Identity()
+        else:
+            self.layer_norm = LayerNorm(
+                output_size if output_size else hidden_size, eps=1e-3
+            )
         self.lin_a = nn.Linear(input_size, hidden_size)
         if context_hidden_size is not None:
             self.lin_c = nn.Linear(context_hidden_size, hidden_size, bias=False)
@@ -74,6 +79,14 @@ class GRN(nn.Module):
         self.out_proj = nn.Linear(input_size, output_size) if output_size else None
         self.activation_fn = get_activation_fn(activation)
 
+    def _load_from_state_dict(self, state_dict, prefix, *args, **kwargs):
+        # checkpoints stored with the LayerNorm wrapped in `layer_norm.ln`
+        for name in ["weight", "bias"]:
+            key = f"{prefix}layer_norm.ln.{name}"
+            if key in state_dict:
+                state_dict[f"{prefix}layer_norm.{name}"] = state_dict.pop(key)
+        super()._load_from_state_dict(state_dict, prefix, *args, **kwargs)
+
     def forward(self, a: Tensor, c: Optional[Tensor] = None):
         x = self.lin_a(a)
         if c is not None:
@@ -81,12 +94,98 @@ class GRN(nn.Module):
         x = self.activation_fn(x)
         x = self.lin_i(x)
         x = self.dropout(x)
-        x = self.glu(x)
         y = a if not self.out_proj else self.out_proj(a)
-        x = x + y
-        x = self.layer_norm(x)
+        ln = self.layer_norm
+        if isinstance(ln, LayerNorm):
+            x = _glu_add_layer_norm(self.glu.lin(x), y, ln.weight, ln.bias, ln.eps)
+        else:
+            x = self.glu(x) + y
         return x
 
+
+class BatchedGRN(nn.Module):
+    """Independent GRNs (without context nor output projection) evaluated
+    together with batched matrix multiplications, the i-th GRN is applied to
+    `x[..., i, :]`. Equivalent to `num_grns` separate `GRN(hidden_size, hidden_size)`.
+    """
+
+    # parameter names of the equivalent per-variable `GRN` modules
+    _grn_keys = {
+        "lin_a_weight": "lin_a.weight",
+        "lin_a_bias": "lin_a.bias",
+        "lin_i_weight": "lin_i.weight",
+        "lin_i_bias": "lin_i.bias",
+        "glu_weight": "glu.lin.weight",
+        "glu_bias": "glu.lin.bias",
+        "ln_weight": "layer_norm.ln.weight",
+        "ln_bias": "layer_norm.ln.bias",
+    }
+
+    def __init__(self, num_grns, hidden_size, dropout=0, activation="ELU"):
+        super().__init__()
+        self.num_grns = num_grns
+        self.hidden_size = hidden_size
+        self.lin_a_weight = nn.Parameter(
+            torch.empty(num_grns, hidden_size, hidden_size)
+        )
+        self.lin_a_bias = nn.Parameter(torch.empty(num_grns, hidden_size))
+        self.lin_i_weight = nn.Parameter(
+            torch.empty(num_grns, hidden_size, hidden_size)
+        )
+        self.lin_i_bias = nn.Parameter(torch.empty(num_grns, hidden_size))
+        self.glu_weight = nn.Parameter(
+            torch.empty(num_grns, 2 * hidden_size, hidden_size)
+        )
+        self.glu_bias = nn.Parameter(torch.empty(num_grns, 2 * hidden_size))
+        self.ln_weight = nn.Parameter(torch.ones(num_grns, hidden_size))
+        self.ln_bias = nn.Parameter(torch.zeros(num_grns, hidden_size))
+        self.dropout = nn.Dropout(dropout)
+        self.activation_fn = get_activation_fn(activation)
+        self.reset_parameters()
+
+    def reset_parameters(self):
+        # same initialization, in the same order, as one nn.Linear per GRN
+        for i in range(self.num_grns):
+            for weight, bias in [
+                (self.lin_a_weight, self.lin_a_bias),
+                (self.lin_i_weight, self.lin_i_bias),
+                (self.glu_weight, self.glu_bias),
+            ]:
+                nn.init.kaiming_uniform_(weight[i], a=math.sqrt(5))
+                bound = 1 / math.sqrt(weight.shape[-1])
+                nn.init.uniform_(bias[i], -bound, bound)
+
+    def _load_from_state_dict(self, state_dict, prefix, *args, **kwargs):
+        # checkpoints stored with one `GRN` module per variable
+        if f"{prefix}0.lin_a.weight" in state_dict:
+            for name, grn_key in self._grn_keys.items():
+                state_dict[prefix + name] = torch.stack(
+                    [
+                        state_dict.pop(f"{prefix}{i}.{grn_key}")
+                        for i in range(self.num_grns)
+                    ]
+                )
+        super()._load_from_state_dict(state_dict, prefix, *args, **kwargs)
+
+    def _linear(self, x: Tensor, weight: Tensor, bias: Tensor) -> Tensor:
+        # [V,N,in] x [V,in,out] + [V,1,out] -> [V,N,out]
+        return torch.baddbmm(bias.unsqueeze(1), x, weight.transpose(1, 2))
+
+    def forward(self, a: Tensor) -> Tensor:
+        # [...,V,H] -> [V,N,H]
+        batch_shape = a.shape[:-2]
+        a = a.reshape(-1, self.num_grns, self.hidden_size).transpose(0, 1)
+        x = self._linear(a, self.lin_a_weight, self.lin_a_bias)
+        x = self.activation_fn(x)
+        x = self._linear(x, self.lin_i_weight, self.lin_i_bias)
+        x = self.dropout(x)
+        x = F.glu(self._linear(x, self.glu_weight, self.glu_bias))
+        x = x + a
+        x = F.layer_norm(x, (self.hidden_size,), eps=1e-3)
+        x = torch.addcmul(self.ln_bias.unsqueeze(1), x, self.ln_weight.unsqueeze(1))
+        # [V,N,H] -> [...,V,H]
+        return x.transpose(0, 1).reshape(*batch_shape, self.num_grns, self.hidden_size)
+
 # %% ../../nbs/models.tft.ipynb 14
 class TFTEmbedding(nn.Module):
     def __init__(
@@ -134,8 +233,8 @@ class TFTEmbedding(nn.Module):
             # the line below is equivalent to following einsums
             # e_cont = torch.einsum('btf,fh->bthf', cont, cont_emb)
             # e_cont = torch.einsum('bf,fh->bhf', cont, cont_emb)
-            e_cont = torch.mul(cont.unsqueeze(-1), cont_emb)
-            e_cont = e_cont + cont_bias
+            # fused multiply-add, single pass over the [..., F, H] output
+            e_cont = torch.addcmul(cont_bias, cont.unsqueeze(-1), cont_emb)
             return e_cont
 
         return None
@@ -153,27 +252,29 @@ class TFTEmbedding(nn.Module):
             cont_emb=self.stat_exog_embedding_vectors,
             cont_bias=self.stat_exog_embedding_bias,
         )
-        k_inp = self._apply_embedding(
-            cont=futr_exog,
+        # Historical inputs [observed exog, known exog, observed targets]
+        # are embedded with a single packed multiply-add directly in their
+        # final layout, the known exog beyond the encoder are future inputs
+        encoder_length = target_inp.shape[1]
+        conts = [futr_exog[:, :encoder_length], target_inp]
+        embs = [self.futr_exog_embedding_vectors, self.tgt_embedding_vectors]
+        biases = [self.futr_exog_embedding_bias, self.tgt_embedding_bias]
+        if hist_exog is not None:
+            conts.insert(0, hist_exog[:, :encoder_length])
+            embs.insert(0, self.hist_exog_embedding_vectors)
+            biases.insert(0, self.hist_exog_embedding_bias)
+        historical_inp = self._apply_embedding(
+            cont=torch.cat(conts, dim=-1),
+            cont_emb=torch.cat(embs),
+            cont_bias=torch.cat(biases),
+        )
+        future_inp = self._apply_embedding(
+            cont=futr_exog[:, encoder_length:],
             cont_emb=self.futr_exog_embedding_vectors,
             cont_bias=self.futr_exog_embedding_bias,
         )
-        o_inp = self._apply_embedding(
-            cont=hist_exog,
-            cont_emb=self.hist_exog_embedding_vectors,
-            cont_bias=self.hist_exog_embedding_bias,
-        )
 
-        # Temporal observed targets
-        # t_observed_tgt = torch.einsum('btf,fh->btfh',
-        #                               target_inp, self.tgt_embedding_vectors)
-        target_inp = torch.matmul(
-            target_inp.unsqueeze(3).unsqueeze(4),
-            self.tgt_embedding_vectors.unsqueeze(1),
-        ).squeeze(3)
-        target_inp = target_inp + self.tgt_embedding_bias
-
-        return s_inp, k_inp, o_inp, target_inp
+        return s_inp, historical_inp, future_inp
 
 
 class VariableSelectionNetwork(nn.Module):
@@ -186,30 +287,24 @@ class VariableSelectionNetwork(nn.Module):
             context_hidden_size=hidden_size,
             activation=grn_activation,
         )
-        self.var_grns = nn.ModuleList(
-            [
-                GRN(
-                    input_size=hidden_size,
-                    hidden_size=hidden_size,
-                    dropout=dropout,
-                    activation=grn_activation,
-                )
-                for _ in range(num_inputs)
-            ]
+        self.var_grns = BatchedGRN(
+            num_grns=num_inputs,
+            hidden_size=hidden_size,
+            dropout=dropout,
+            activation=grn_activation,
         )
 
     def forward(self, x: Tensor, context: Optional[Tensor] = None):
         Xi = x.reshape(*x.shape[:-2], -1)
         grn_outputs = self.joint_grn(Xi, c=context)
         sparse_weights = F.softmax(grn_outputs, dim=-1)
-        transformed_embed_list = [m(x[..., i, :]) for i, m in enumerate(self.var_grns)]
-        transformed_embed = torch.stack(transformed_embed_list, dim=-1)
-        # the line below performs batched matrix vector multiplication
-        # for temporal features it's bthf,btf->bth
-        # for static features it's bhf,bf->bh
-        variable_ctx = torch.matmul(
-            transformed_embed, sparse_weights.unsqueeze(-1)
-        ).squeeze(-1)
+        transformed_embed = self.var_grns(x)
+        # weighted sum of the transformed variables, a single contraction
+        # for temporal features it's btf,btfh->bth
+        # for static features it's bf,bfh->bh
+        variable_ctx = torch.einsum(
+            "...f,...fh->...h", sparse_weights, transformed_embed
+        )
 
         return variable_ctx, sparse_weights
 
@@ -228,41 +323,73 @@ class InterpretableMultiHeadAttention(nn.Module):
         self.attn_dropout = nn.Dropout(attn_dropout)
         self.out_dropout = nn.Dropout(dropout)
         self.scale = self.d_head**-0.5
+        # boolean causal mask, True above the diagonal
         self.register_buffer(
             "_mask",
             torch.triu(
-                torch.full((example_length, example_length), float("-inf")), 1
+                torch.ones((example_length, example_length), dtype=torch.bool), 1
             ).unsqueeze(0),
         )
 
     def forward(
-        self, x: Tensor, mask_future_timesteps: bool = True
-    ) -> Tuple[Tensor, Tensor]:
+        self,
+        x: Tensor,
+        mask_future_timesteps: bool = True,
+        need_weights: bool = True,
+        query_start: int = 0,
+    ) -> Tuple[Tensor, Optional[Tensor]]:
         # [Batch,Time,MultiHead,AttDim] := [N,T,M,AD]
+        # only the timesteps from `query_start` on are used as queries,
+        # keys and values cover the whole sequence
         bs, t, h_size = x.shape
-        qkv = self.qkv_linears(x)
-        q, k, v = qkv.split(
-            (self.n_head * self.d_head, self.n_head * self.d_head, self.d_head), dim=-1
+        t_q = t - query_start
+        # separate projections with slices of the packed weight, each output
+        # is contiguous so the head-major views below are pure stride changes
+        w_q, w_k, w_v = self.qkv_linears.weight.split(
+            (self.n_head * self.d_head, self.n_head * self.d_head, self.d_head), dim=0
         )
-        q = q.view(bs, t, self.n_head, self.d_head)
-        k = k.view(bs, t, self.n_head, self.d_head)
-        v = v.view(bs, t, self.d_head)
-
-        # [N,T1,M,Ad] x [N,T2,M,Ad] -> [N,M,T1,T2]
-        # attn_score = torch.einsum('bind,bjnd->bnij', q, k)
-        attn_score = torch.matmul(q.permute((0, 2, 1, 3)), k.permute((0, 2, 3, 1)))
+        # [N,T,M*Ad] -> [N,M,T,Ad]
+        q = F.linear(x[:, query_start:], w_q)
+        q = q.view(bs, t_q, self.n_head, self.d_head).transpose(1, 2)
+        k = F.linear(x, w_k).view(bs, t, self.n_head, self.d_head).transpose(1, 2)
+        v = F.linear(x, w_v)
+
+        if not need_weights:
+            # Fused kernel, the [N,M,T1,T2] probabilities are never materialized.
+            # The shared values are broadcasted across heads without a copy.
+            # rectangular causal masks need an explicit (attend=True) mask
+            attn_mask = None
+            if mask_future_timesteps and query_start > 0:
+                attn_mask = ~self._mask[:, query_start:t, :t]
+            attn_vec = F.scaled_dot_product_attention(
+                q,
+                k,
+                v.unsqueeze(1).expand(-1, self.n_head, -1, -1),
+                attn_mask=attn_mask,
+                dropout_p=self.attn_dropout.p if self.training else 0.0,
+                is_causal=mask_future_timesteps and attn_mask is None,
+            )
+            m_attn_vec = torch.mean(attn_vec, dim=1)
+            out = self.out_proj(m_attn_vec)
+            out = self.out_dropout(out)
+            return out, None
+
+        # [N,M,T1,Ad] x [N,M,Ad,T2] -> [N,M,T1,T2]
+        # attn_score = torch.einsum('bnid,bnjd->bnij', q, k)
+        attn_score = torch.matmul(q, k.transpose(2, 3))
         attn_score.mul_(self.scale)
 
         if mask_future_timesteps:
-            attn_score = attn_score + self._mask
+            attn_score.masked_fill_(self._mask[:, query_start:t, :t], float("-inf"))
 
         attn_prob = F.softmax(attn_score, dim=3)
         attn_prob = self.attn_dropout(attn_prob)
 
-        # [N,M,T1,T2] x [N,M,T1,Ad] -> [N,M,T1,Ad]
-        # attn_vec = torch.einsum('bnij,bjd->bnid', attn_prob, v)
-        attn_vec = torch.matmul(attn_prob, v.unsqueeze(1))
-        m_attn_vec = torch.mean(attn_vec, dim=1)
+        # values are shared across heads, so averaging the probabilities
+        # first is equivalent to averaging the per head attention vectors
+        # [N,T1,T2] x [N,T2,Ad] -> [N,T1,Ad]
+        m_attn_prob = torch.mean(attn_prob, dim=1)
+        m_attn_vec = torch.matmul(m_attn_prob, v)
         out = self.out_proj(m_attn_vec)
         out = self.out_dropout(out)
 
@@ -278,11 +405,8 @@ class StaticCovariateEncoder(nn.Module):
             dropout=dropout,
             grn_activation=grn_activation,
         )
-        self.context_grns = nn.ModuleList(
-            [
-                GRN(input_size=hidden_size, hidden_size=hidden_size, dropout=dropout)
-                for _ in range(4)
-            ]
+        self.context_grns = BatchedGRN(
+            num_grns=4, hidden_size=hidden_size, dropout=dropout
         )
 
     def forward(self, x: Tensor) -> Tuple[Tensor, Tensor, Tensor, Tensor]:
@@ -293,14 +417,22 @@ class StaticCovariateEncoder(nn.Module):
         # enrichment context
         # state_c context
         # state_h context
-        cs, ce, ch, cc = tuple(m(variable_ctx) for m in self.context_grns)  # type: ignore
+        # the four context GRNs share the same input, [B,H] -> [B,4,H]
+        context = self.context_grns(variable_ctx.unsqueeze(-2).expand(-1, 4, -1))
+        cs, ce, ch, cc = context.unbind(dim=-2)
 
         return cs, ce, ch, cc, sparse_weights  # type: ignore
 
 # %% ../../nbs/models.tft.ipynb 21
 class TemporalCovariateEncoder(nn.Module):
     def __init__(
-        self, hidden_size, num_historic_vars, num_future_vars, dropout, grn_activation
+        self,
+        hidden_size,
+        num_historic_vars,
+        num_future_vars,
+        dropout,
+        grn_activation,
+        share_lstm=False,
     ):
         super(TemporalCovariateEncoder, self).__init__()
 
@@ -320,8 +452,13 @@ class TemporalCovariateEncoder(nn.Module):
             dropout=dropout,
             grn_activation=grn_activation,
         )
-        self.future_encoder = nn.LSTM(
-            input_size=hidden_size, hidden_size=hidden_size, batch_first=True
+        # with a shared LSTM the full window is encoded in a single call
+        self.future_encoder = (
+            None
+            if share_lstm
+            else nn.LSTM(
+                input_size=hidden_size, hidden_size=hidden_size, batch_first=True
+            )
         )
 
         # Shared Gated-Skip Connection
@@ -333,17 +470,23 @@ class TemporalCovariateEncoder(nn.Module):
         historical_features, history_vsn_sparse_weights = self.history_vsn(
             historical_inputs, cs
         )
-        history, state = self.history_encoder(historical_features, (ch, cc))
-
         future_features, future_vsn_sparse_weights = self.future_vsn(future_inputs, cs)
-        future, _ = self.future_encoder(future_features, state)
-        # torch.cuda.synchronize() # this call gives prf boost for unknown reasons
-
         input_embedding = torch.cat([historical_features, future_features], dim=1)
-        temporal_features = torch.cat([history, future], dim=1)
-        temporal_features = self.input_gate(temporal_features)
-        temporal_features = temporal_features + input_embedding
-        temporal_features = self.input_gate_ln(temporal_features)
+
+        if self.future_encoder is None:
+            temporal_features, _ = self.history_encoder(input_embedding, (ch, cc))
+        else:
+            history, state = self.history_encoder(historical_features, (ch, cc))
+            future, _ = self.future_encoder(future_features, state)
+            # torch.cuda.synchronize() # this call gives prf boost for unknown reasons
+            temporal_features = torch.cat([history, future], dim=1)
+        temporal_features = _glu_add_layer_norm(
+            self.input_gate.lin(temporal_features),
+            input_embedding,
+            self.input_gate_ln.weight,
+            self.input_gate_ln.bias,
+            self.input_gate_ln.eps,
+        )
         return temporal_features, history_vsn_sparse_weights, future_vsn_sparse_weights
 
 # %% ../../nbs/models.tft.ipynb 23
@@ -390,34 +533,70 @@ class TemporalFusionDecoder(nn.Module):
         self.decoder_gate = GLU(hidden_size, hidden_size)
         self.decoder_ln = LayerNorm(normalized_shape=hidden_size, eps=1e-3)
 
-    def forward(self, temporal_features, ce):
+    def forward(self, temporal_features, ce, need_weights: bool = True):
         # ------------- Encoder-Decoder Attention --------------#
         # Static enrichment
         enriched = self.enrichment_grn(temporal_features, c=ce)
 
-        # Temporal self attention
-        x, atten_vect = self.attention(enriched, mask_future_timesteps=True)
+        # Temporal self attention, unless the full attention weights are
+        # requested only the forecast horizon is used as queries
+        query_start = 0 if need_weights else self.encoder_length
+        x, atten_vect = self.attention(
+            enriched,
+            mask_future_timesteps=True,
+            need_weights=need_weights,
+            query_start=query_start,
+        )
 
         # Don't compute historical quantiles
-        x = x[:, self.encoder_length :, :]
+        x = x[:, self.encoder_length - query_start :, :]
         temporal_features = temporal_features[:, self.encoder_length :, :]
         enriched = enriched[:, self.encoder_length :, :]
 
-        x = self.attention_gate(x)
-        x = x + enriched
-        x = self.attention_ln(x)
+        x = _glu_add_layer_norm(
+            self.attention_gate.lin(x),
+            enriched,
+            self.attention_ln.weight,
+            self.attention_ln.bias,
+            self.attention_ln.eps,
+        )
 
         # Position-wise feed-forward
         x = self.positionwise_grn(x)
 
         # ---------------------- Decoder ----------------------#
         # Final skip connection
-        x = self.decoder_gate(x)
-        x = x + temporal_features
-        x = self.decoder_ln(x)
+        x = _glu_add_layer_norm(
+            self.decoder_gate.lin(x),
+            temporal_features,
+            self.decoder_ln.weight,
+            self.decoder_ln.bias,
+            self.decoder_ln.eps,
+        )
 
         return x, atten_vect
 
+
+class _TFTTrainingCore(nn.Module):
+    """Temporal encoder and fusion decoder training pass with tensor only
+    inputs and outputs, as required by `torch.cuda.make_graphed_callables`.
+    Holds references to the TFT submodules, it is not registered in the model.
+    """
+
+    def __init__(self, temporal_encoder, temporal_fusion_decoder):
+        super().__init__()
+        self.temporal_encoder = temporal_encoder
+        self.temporal_fusion_decoder = temporal_fusion_decoder
+
+    def forward(self, historical_inputs, future_inputs, cs, ce, ch, cc):
+        temporal_features, history_vsn_wgts, future_vsn_wgts = self.temporal_encoder(
+            historical_inputs, future_inputs, cs, ch, cc
+        )
+        temporal_features, _ = self.temporal_fusion_decoder(
+            temporal_features, ce, need_weights=False
+        )
+        return temporal_features, history_vsn_wgts, future_vsn_wgts
+
 # %% ../../nbs/models.tft.ipynb 24
 class TFT(BaseWindows):
     """TFT
@@ -438,6 +617,10 @@ class TFT(BaseWindows):
     `dropout`: float (0, 1), dropout of inputs VSNs.<br>
     `n_head`: int=4, number of attention heads in temporal fusion decoder.<br>
     `attn_dropout`: float (0, 1), dropout of fusion decoder's attention layer.<br>
+    `share_lstm`: bool=False, if True the historic and future features are encoded by a single LSTM in one call over the full window, instead of separate encoder and decoder LSTMs.<br>
+    `compile_model`: bool=False, whether to compile the embedding, encoders and decoder with `torch.compile`, the first training or inference call triggers the compilation.<br>
+    `use_cuda_graph`: bool=False, whether to replay the encoder and decoder training passes (forward and backward) on CUDA from graphs captured once per input shape.<br>
+    `autocast_dtype`: torch.dtype, optional, if set (e.g. `torch.bfloat16`) the embeddings, encoders and decoder run under `torch.autocast`, the output adapter stays in full precision.<br>
     `grn_activation`: str, activation for the GRN module from ['ReLU', 'Softplus', 'Tanh', 'SELU', 'LeakyReLU', 'Sigmoid', 'ELU', 'GLU'].<br>
     `loss`: PyTorch module, instantiated train loss class from [losses collection](https://nixtla.github.io/neuralforecast/losses.pytorch.html).<br>
     `valid_loss`: PyTorch module=`loss`, instantiated valid loss class from [losses collection](https://nixtla.github.io/neuralforecast/losses.pytorch.html).<br>
@@ -487,6 +670,10 @@ class TFT(BaseWindows):
         attn_dropout: float = 0.0,
         grn_activation: str = "ELU",
         dropout: float = 0.1,
+        share_lstm: bool = False,
+        compile_model: bool = False,
+        use_cuda_graph: bool = False,
+        autocast_dtype: Optional[torch.dtype] = None,
         loss=MAE(),
         valid_loss=None,
         max_steps: int = 1000,
@@ -545,6 +732,15 @@ class TFT(BaseWindows):
         self.interpretability_params = dict([])  # type: ignore
         self.tgt_size = tgt_size
         self.grn_activation = grn_activation
+        self.autocast_dtype = autocast_dtype
+        self.compile_model = compile_model
+        self._compiled_modules = {}
+        if use_cuda_graph and (compile_model or autocast_dtype is not None):
+            raise Exception(
+                "use_cuda_graph can not be combined with compile_model or autocast_dtype."
+            )
+        self.use_cuda_graph = use_cuda_graph
+        self._cuda_graphs = {}
         futr_exog_size = max(self.futr_exog_size, 1)
         num_historic_vars = futr_exog_size + self.hist_exog_size + tgt_size
 
@@ -571,6 +767,7 @@ class TFT(BaseWindows):
             num_future_vars=futr_exog_size,
             dropout=dropout,
             grn_activation=self.grn_activation,
+            share_lstm=share_lstm,
         )
 
         # ------------------------------ Decoders -----------------------------#
@@ -589,6 +786,44 @@ class TFT(BaseWindows):
             in_features=hidden_size, out_features=self.loss.outputsize_multiplier
         )
 
+    def __getstate__(self):
+        # compiled submodules and CUDA graphs wrap this instance's modules, copies
+        # (e.g. the one fitted by NeuralForecast) build their own when needed
+        state = super().__getstate__()
+        state["_compiled_modules"] = {}
+        state["_cuda_graphs"] = {}
+        return state
+
+    def setup(self, stage):
+        # Compilation is deferred to the trainer, the model is deep-copied
+        # before training. Submodules are compiled separately with dynamic
+        # shapes, so varying batch sizes do not trigger recompilations.
+        if self.compile_model and not self._compiled_modules:
+            names = ["embedding", "temporal_encoder", "temporal_fusion_decoder"]
+            if self.stat_exog_size > 0:
+                names.append("static_encoder")
+            self._compiled_modules = {
+                name: torch.compile(getattr(self, name), dynamic=True) for name in names
+            }
+
+    def _submodule(self, name):
+        # compiled wrapper when `compile_model`, the eager module otherwise
+        return self._compiled_modules.get(name, getattr(self, name))
+
+    def _graphed_training_core(self, *inputs):
+        # graphs are captured for each new input shape, after a few warmup
+        # iterations run by `make_graphed_callables`
+        key = tuple((tuple(x.shape), x.requires_grad) for x in inputs)
+        if key not in self._cuda_graphs:
+            core = _TFTTrainingCore(self.temporal_encoder, self.temporal_fusion_decoder)
+            sample_inputs = tuple(
+                x.detach().clone().requires_grad_(x.requires_grad) for x in inputs
+            )
+            self._cuda_graphs[key] = torch.cuda.make_graphed_callables(
+                core, sample_inputs
+            )
+        return self._cuda_graphs[key](*inputs)
+
     def forward(self, windows_batch):
 
         # Parsiw windows_batch
@@ -599,66 +834,94 @@ class TFT(BaseWindows):
 
         if futr_exog is None:
             futr_exog = y_insample[:, [-1]]
-            futr_exog = futr_exog.repeat(1, self.example_length, 1)
+            # broadcast view, the embedding consumes it without a copy
+            futr_exog = futr_exog.expand(-1, self.example_length, -1)
 
-        s_inp, k_inp, o_inp, t_observed_tgt = self.embedding(
-            target_inp=y_insample,
-            hist_exog=hist_exog,
-            futr_exog=futr_exog,
-            stat_exog=stat_exog,
-        )
-
-        # -------------------------------- Inputs ------------------------------#
-        # Static context
-        if s_inp is not None:
-            cs, ce, ch, cc, static_encoder_sparse_weights = self.static_encoder(s_inp)
-            ch, cc = ch.unsqueeze(0), cc.unsqueeze(0)  # LSTM initial states
+        # Optional mixed precision, the loss adapter stays in full precision
+        if self.autocast_dtype is None:
+            autocast = nullcontext()
         else:
-            # If None add zeros
-            batch_size, example_length, target_size, hidden_size = t_observed_tgt.shape
-            cs = torch.zeros(size=(batch_size, hidden_size), device=y_insample.device)
-            ce = torch.zeros(size=(batch_size, hidden_size), device=y_insample.device)
-            ch = torch.zeros(
-                size=(1, batch_size, hidden_size), device=y_insample.device
+            autocast = torch.autocast(
+                device_type=y_insample.device.type, dtype=self.autocast_dtype
             )
-            cc = torch.zeros(
-                size=(1, batch_size, hidden_size), device=y_insample.device
+        with autocast:
+            s_inp, historical_inputs, future_inputs = self._submodule("embedding")(
+                target_inp=y_insample,
+                hist_exog=hist_exog,
+                futr_exog=futr_exog,
+                stat_exog=stat_exog,
             )
-            static_encoder_sparse_weights = []
-
-        # Historical inputs
-        _historical_inputs = [
-            k_inp[:, : self.input_size, :],
-            t_observed_tgt[:, : self.input_size, :],
-        ]
-        if o_inp is not None:
-            _historical_inputs.insert(0, o_inp[:, : self.input_size, :])
-        historical_inputs = torch.cat(_historical_inputs, dim=-2)
-        # Future inputs
-        future_inputs = k_inp[:, self.input_size :]
-
-        # ---------------------------- Encode/Decode ---------------------------#
-        # Embeddings + VSN + LSTM encoders
-        temporal_features, history_vsn_wgts, future_vsn_wgts = self.temporal_encoder(
-            historical_inputs=historical_inputs,
-            future_inputs=future_inputs,
-            cs=cs,
-            ch=ch,
-            cc=cc,
-        )
 
-        # Static enrichment, Attention and decoders
-        temporal_features, attn_wts = self.temporal_fusion_decoder(
-            temporal_features=temporal_features, ce=ce
-        )
+            # -------------------------------- Inputs ------------------------------#
+            # Static context
+            if s_inp is not None:
+                cs, ce, ch, cc, static_encoder_sparse_weights = self._submodule(
+                    "static_encoder"
+                )(s_inp)
+                ch, cc = ch.unsqueeze(0), cc.unsqueeze(0)  # LSTM initial states
+            else:
+                # If None add zeros
+                batch_size, input_size, num_historic_vars, hidden_size = (
+                    historical_inputs.shape
+                )
+                cs = torch.zeros(
+                    size=(batch_size, hidden_size), device=y_insample.device
+                )
+                ce = torch.zeros(
+                    size=(batch_size, hidden_size), device=y_insample.device
+                )
+                ch = torch.zeros(
+                    size=(1, batch_size, hidden_size), device=y_insample.device
+                )
+                cc = torch.zeros(
+                    size=(1, batch_size, hidden_size), device=y_insample.device
+                )
+                static_encoder_sparse_weights = []
+
+            # ---------------------------- Encode/Decode ---------------------------#
+            if self.use_cuda_graph and self.training and y_insample.is_cuda:
+                temporal_features, history_vsn_wgts, future_vsn_wgts = (
+                    self._graphed_training_core(
+                        historical_inputs, future_inputs, cs, ce, ch, cc
+                    )
+                )
+                attn_wts = None
+            else:
+                # Embeddings + VSN + LSTM encoders
+                temporal_features, history_vsn_wgts, future_vsn_wgts = self._submodule(
+                    "temporal_encoder"
+                )(
+                    historical_inputs=historical_inputs,
+                    future_inputs=future_inputs,
+                    cs=cs,
+                    ch=ch,
+                    cc=cc,
+                )
 
-        # Store params
-        self.interpretability_params = {
+                # Static enrichment, Attention and decoders
+                # Attention weights are only needed for interpretability, training
+                # uses the fused attention kernel instead
+                temporal_features, attn_wts = self._submodule(
+                    "temporal_fusion_decoder"
+                )(
+                    temporal_features=temporal_features,
+                    ce=ce,
+                    need_weights=not self.training,
+                )
+        temporal_features = temporal_features.to(y_insample.dtype)
+
+        # Store params, detached from the graph so that a trained model can
+        # still be deep-copied
+        interpretability_params = {
             "history_vsn_wgts": history_vsn_wgts,
             "future_vsn_wgts": future_vsn_wgts,
             "static_encoder_sparse_weights": static_encoder_sparse_weights,
             "attn_wts": attn_wts,
         }
+        self.interpretability_params = {
+            k: v.detach() if isinstance(v, torch.Tensor) else v
+            for k, v in interpretability_params.items()
+        }
 
         # Adapt output to loss
         y_hat = self.output_adapter(temporal_features)
@@ -667,6 +930,9 @@ class TFT(BaseWindows):
         return y_hat
 
     def mean_on_batch(self, tensor):
+        # interpretability tensors from autocast runs are averaged in float32
+        if tensor.dtype in (torch.float16, torch.bfloat16):
+            tensor = tensor.float()
         batch_size = tensor.size(0)
         if batch_size > 1:
             return tensor.mean(dim=0)
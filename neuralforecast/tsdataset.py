@@ -598,6 +598,16 @@ class TimeSeriesDataModule(pl.LightningDataModule):
         self.drop_last = drop_last
         self.shuffle_train = shuffle_train
 
+    def _worker_kwargs(self, persistent=True):
+        # with background workers pin the batches so the host to device copy can
+        # be asynchronous, and keep the workers alive across epochs
+        if self.num_workers == 0:
+            return {}
+        return dict(
+            persistent_workers=persistent,
+            pin_memory=torch.cuda.is_available(),
+        )
+
     def train_dataloader(self):
         loader = TimeSeriesLoader(
             self.dataset,
@@ -605,6 +615,7 @@ class TimeSeriesDataModule(pl.LightningDataModule):
             num_workers=self.num_workers,
             shuffle=self.shuffle_train,
             drop_last=self.drop_last,
+            **self._worker_kwargs()
         )
         return loader
 
@@ -615,6 +626,7 @@ class TimeSeriesDataModule(pl.LightningDataModule):
             num_workers=self.num_workers,
             shuffle=False,
             drop_last=self.drop_last,
+            **self._worker_kwargs()
         )
         return loader
 
@@ -624,6 +636,8 @@ class TimeSeriesDataModule(pl.LightningDataModule):
             batch_size=self.valid_batch_size,
             num_workers=self.num_workers,
             shuffle=False,
+            # predictions are a single pass over the data
+            **self._worker_kwargs(persistent=False)
         )
         return loader
 
@@ -414,8 +414,6 @@ def augment_calendar_df(df, freq="H"):
     > * S - [Second of minute, minute of hour, hour of day, day of week, day of month, day of year]
     *minute returns a number from 0-3 corresponding to the 15 minute period it falls into.
     """
-    df = df.copy()
-
     freq_map = {
         "Q": ["month"],
         "M": ["month"],